@@ -18,6 +18,7 @@ bl_info = {
 import bpy
 from bpy.props import StringProperty, IntProperty, FloatProperty, BoolProperty
 
+from . import daemon
 from . import operators
 from . import ui
 
@@ -77,12 +78,14 @@ class GPAI_SceneProperties(bpy.types.PropertyGroup):
         name="Character",
         description="Character name for tracking (helps improve future generations)",
         default="",
+        update=ui.redraw_panels,
     )
 
     last_motion_type: StringProperty(
         name="Last Motion Type",
         description="Motion type detected in last generation",
         default="",
+        update=ui.redraw_panels,
     )
 
     last_output_dir: StringProperty(
@@ -113,8 +116,21 @@ def register():
 
     bpy.types.Scene.gpai = bpy.props.PointerProperty(type=GPAI_SceneProperties)
 
+    # Resolve the binary once; operators stay disabled if it is missing
+    try:
+        binary = operators._resolve_binary()
+    except FileNotFoundError as e:
+        print(f"[GPAI] {e}")
+    else:
+        # Keep one binary process alive for accept/reject/stats
+        daemon.start(binary)
+
 
 def unregister():
+    operators.shutdown_log_executor()
+    daemon.stop()
+    operators.remove_work_dir()
+
     del bpy.types.Scene.gpai
 
     for cls in reversed(classes):
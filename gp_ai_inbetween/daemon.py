@@ -0,0 +1,109 @@
+"""
+Long-lived Rust process for feedback commands.
+
+Accept/reject/stats are tiny control messages, so instead of spawning the
+binary for each click we keep one `gp_inbetween serve` process alive and
+exchange newline-delimited JSON with it over its stdin/stdout.
+"""
+
+import json
+import queue
+import subprocess
+import threading
+
+_process = None
+_responses = None
+_lock = threading.Lock()
+
+# Seconds to wait for a response before giving up on the daemon
+_REQUEST_TIMEOUT = 5
+
+
+def _read_responses(stdout, responses):
+    """Reader thread: forward response lines until the pipe closes."""
+    for line in stdout:
+        responses.put(line)
+    responses.put("")
+
+
+def start(binary):
+    """Spawn the binary in serve mode unless it is already running."""
+    global _process, _responses
+
+    with _lock:
+        if _process is not None and _process.poll() is None:
+            return
+
+        try:
+            _process = subprocess.Popen(
+                [binary, "serve"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as e:
+            print(f"[GPAI] Could not start daemon: {e}")
+            _process = None
+            return
+
+        # Responses are read on their own thread so a stalled daemon can
+        # time out instead of blocking readline() while the lock is held
+        _responses = queue.Queue()
+        threading.Thread(
+            target=_read_responses,
+            args=(_process.stdout, _responses),
+            name="gpai-daemon",
+            daemon=True,
+        ).start()
+
+
+def stop():
+    """Close the daemon's stdin and wait for it to exit."""
+    global _process
+
+    with _lock:
+        proc, _process = _process, None
+
+    if proc is None:
+        return
+
+    try:
+        proc.stdin.close()
+        proc.wait(timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+
+
+def request(payload):
+    """Send one request and return the decoded response.
+
+    Returns None if the daemon is not running or doesn't answer within
+    _REQUEST_TIMEOUT seconds, so the caller can fall back to a one-shot
+    subprocess.
+    """
+    global _process
+
+    with _lock:
+        if _process is None or _process.poll() is not None:
+            return None
+
+        try:
+            _process.stdin.write(json.dumps(payload) + "\n")
+            _process.stdin.flush()
+            line = _responses.get(timeout=_REQUEST_TIMEOUT)
+        except (OSError, ValueError, queue.Empty):
+            line = ""
+
+        if not line:
+            # Binary predates `serve`, crashed or stalled; stop using it
+            _process.kill()
+            _process = None
+            return None
+
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return None
@@ -3,52 +3,232 @@ Operators that call the Rust binary.
 """
 
 import bpy
+import gpu
+import array
+import bisect
+import concurrent.futures
+import hashlib
+import shutil
 import subprocess
 import tempfile
 import json
 import platform
 import os
+import select
+import time
 from pathlib import Path
 from bpy.props import IntProperty, StringProperty, EnumProperty
 
+from . import daemon
 
-def get_binary_path():
-    """Find the Rust binary based on platform."""
-    addon_dir = Path(__file__).parent
-    bin_dir = addon_dir / "bin"
+# Constant for the life of the module, so resolve them once at import
+_PKG = __package__
+_ADDON_DIR = Path(__file__).parent
+_BIN_DIR = _ADDON_DIR / "bin"
+_BINARY_NAME = {
+    "Windows": "gp_inbetween.exe",
+    "Darwin": "gp_inbetween_mac",
+}.get(platform.system(), "gp_inbetween")
+
+# Resolved once in register(); None if the binary is missing
+_BINARY_PATH = None
+
+
+def _is_gp(obj):
+    """True for Grease Pencil v3 objects, the only kind the importer handles."""
+    return getattr(obj, "type", None) == "GREASEPENCIL"
 
-    system = platform.system()
 
-    if system == "Windows":
-        binary = bin_dir / "gp_inbetween.exe"
-    elif system == "Darwin":
-        binary = bin_dir / "gp_inbetween_mac"
-    else:
-        binary = bin_dir / "gp_inbetween"
+def _resolve_binary():
+    """Find the Rust binary for this platform and cache it."""
+    global _BINARY_PATH
 
+    binary = _BIN_DIR / _BINARY_NAME
     if not binary.exists():
         raise FileNotFoundError(
             f"GP AI binary not found at {binary}. "
             "Please ensure the addon is installed correctly."
         )
 
-    return str(binary)
+    _BINARY_PATH = str(binary)
+    return _BINARY_PATH
+
+
+def get_binary_path():
+    """Return the binary path resolved at register time."""
+    if _BINARY_PATH is None:
+        raise FileNotFoundError(
+            "GP AI binary not found. Please ensure the addon is installed correctly."
+        )
+    return _BINARY_PATH
+
+
+# Frame exchange directory reused by every generation; created on first use
+_WORK_DIR = None
+
+# Only one generation may use the exchange directory at a time
+_GENERATION_RUNNING = False
+
+# Cleared when the binary rejects --frame-a-raw (built before it existed)
+_RAW_INPUT_SUPPORTED = True
+
+
+def get_work_dir():
+    """Return the session's frame exchange directory, creating it once."""
+    global _WORK_DIR
+
+    if _WORK_DIR is None or not _WORK_DIR.exists():
+        _WORK_DIR = Path(tempfile.mkdtemp(prefix="gpai_"))
+        (_WORK_DIR / "generated").mkdir()
+
+    return _WORK_DIR
+
+
+def remove_work_dir():
+    """Delete the frame exchange directory."""
+    global _WORK_DIR
+
+    if _WORK_DIR is not None:
+        shutil.rmtree(_WORK_DIR, ignore_errors=True)
+        _WORK_DIR = None
 
 
 def get_preferences():
-    """Get addon preferences."""
-    return bpy.context.preferences.addons[__package__].preferences
+    """Get addon preferences.
+
+    Looked up every time: the RNA pointer doesn't survive loading factory
+    settings or reverting preferences, so it must not be cached.
+    """
+    return bpy.context.preferences.addons[_PKG].preferences
+
+
+def run_command(binary, args, payload, timeout=None, input_text=None, check=False):
+    """Run a feedback command through the daemon, falling back to a one-shot process.
+
+    `input_text` is fed to the fallback process's stdin. With `check`, a
+    failing fallback process raises CalledProcessError. Returns the
+    command's text output.
+    """
+    response = daemon.request(payload)
+    if response is not None:
+        if not response.get("ok"):
+            print(f"[GPAI] {payload['command']} failed: {response.get('error')}")
+        return response.get("output", "")
+
+    result = subprocess.run(
+        [binary, *args],
+        input=input_text,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        timeout=timeout,
+        check=check,
+    )
+    return result.stdout
+
+
+def _frame_index(path):
+    """Numeric index in a generated frame's file name (0 if it has none)."""
+    digits = "".join(filter(str.isdigit, os.path.basename(path)))
+    return int(digits or 0)
+
+
+def list_generated_pngs(output_dir):
+    """Return generated PNG paths in numeric frame order.
+
+    Sorting by the parsed index keeps frame_10 after frame_2, and scandir
+    avoids the per-entry stat that Path.glob does.
+    """
+    return sorted(
+        (entry.path for entry in os.scandir(output_dir) if entry.name.endswith(".png")),
+        key=_frame_index,
+    )
+
+
+# Cleared when the binary rejects accept-batch (built before it existed)
+_ACCEPT_BATCH_SUPPORTED = True
+
+# Feedback logging runs on this thread so the UI never waits on it
+_LOG_EXECUTOR = None
+
+
+def get_log_executor():
+    """Return the single-worker logging executor, creating it on first use."""
+    global _LOG_EXECUTOR
+
+    if _LOG_EXECUTOR is None:
+        _LOG_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="gpai-log"
+        )
+
+    return _LOG_EXECUTOR
+
+
+def shutdown_log_executor():
+    """Stop the logging executor, dropping anything still queued."""
+    global _LOG_EXECUTOR
+
+    if _LOG_EXECUTOR is not None:
+        _LOG_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _LOG_EXECUTOR = None
+
+
+# Model version written to the config; part of the result cache key
+_REPLICATE_MODEL = "fofr/tooncrafter:0d5c6b3a4e0d6b8a9b8e7d6c5b4a3f2e1d0c9b8a"
+
+# Number of past generations kept in the result cache
+_CACHE_MAX_ENTRIES = 32
+
+
+def get_cache_dir():
+    """Return the directory holding cached generation results."""
+    # user_resource has no CACHE type; keep results alongside other addon data
+    return Path(bpy.utils.user_resource("DATAFILES", path="gpai/cache", create=True))
+
+
+def evict_cache(cache_dir):
+    """Delete the least recently used cached generations beyond the limit."""
+    entries = sorted(
+        (entry for entry in os.scandir(cache_dir) if entry.is_dir()),
+        key=lambda entry: entry.stat().st_atime,
+        reverse=True,
+    )
+    for entry in entries[_CACHE_MAX_ENTRIES:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def _hash_png_pixels(digest, path):
+    """Feed a PNG's decoded pixels to `digest`.
+
+    Hashing the file bytes would include the render date and time Blender
+    stamps into the PNG, so identical frames would never match.
+    """
+    image = bpy.data.images.load(str(path), check_existing=False)
+    try:
+        width, height = image.size
+        pixels = array.array("f", [0.0]) * (width * height * image.channels)
+        image.pixels.foreach_get(pixels)
+        digest.update(f"{width}x{height}".encode())
+        digest.update(pixels)
+    finally:
+        bpy.data.images.remove(image)
+
+
+# Digest of the settings last written by get_config_path()
+_CONFIG_DIGEST = None
 
 
 def write_config_file(config_path: Path, api_key: str, threshold: float):
-    """Write a temporary config file with current settings."""
+    """Write the config file with current settings."""
+    # JSON string escaping is valid TOML basic-string syntax, so keys
+    # containing quotes or backslashes can't break out of the value
     config = f"""auto_accept_threshold = {threshold}
 
 [api]
 backend = "replicate"
 endpoint = "http://localhost:8000/generate"
-api_key = "{api_key}"
-replicate_model = "fofr/tooncrafter:0d5c6b3a4e0d6b8a9b8e7d6c5b4a3f2e1d0c9b8a"
+api_key = {json.dumps(api_key)}
+replicate_model = "{_REPLICATE_MODEL}"
 style_strength = 0.8
 timeout_secs = 180
 
@@ -59,7 +239,28 @@ normalize_resolution = true
 min_stroke_length = 5.0
 
 """
-    config_path.write_text(config)
+    # Holds the API key: create it owner-only rather than chmod afterwards,
+    # and tighten an existing file before writing the key into it
+    fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(config)
+
+
+def get_config_path(api_key: str, threshold: float):
+    """Return the addon's config file, rewriting it only when settings change."""
+    global _CONFIG_DIGEST
+
+    config_dir = bpy.utils.user_resource("CONFIG", path="gpai", create=True)
+    config_path = Path(config_dir) / "config.toml"
+
+    digest = hashlib.blake2b(f"{api_key}|{threshold}".encode()).digest()
+    if digest != _CONFIG_DIGEST or not config_path.exists():
+        write_config_file(config_path, api_key, threshold)
+        _CONFIG_DIGEST = digest
+
+    return config_path
 
 
 class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
@@ -67,7 +268,9 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
 
     bl_idname = "gpai.generate_inbetweens"
     bl_label = "Generate Inbetweens"
-    bl_options = {"REGISTER", "UNDO"}
+    # No REGISTER: the redo panel would re-run execute() and start another
+    # background generation from inside the undo cycle
+    bl_options = {"UNDO"}
 
     num_frames: IntProperty(
         name="Number of Frames",
@@ -86,10 +289,9 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         # Check that we have a Grease Pencil object selected
-        obj = context.active_object
-        if obj is None or obj.type != "GREASEPENCIL":
+        if not _is_gp(context.active_object):
             return False
-        return True
+        return _BINARY_PATH is not None and not _GENERATION_RUNNING
 
     def invoke(self, context, event):
         prefs = get_preferences()
@@ -111,6 +313,8 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
             layout.label(text="⚠ Set API key in addon preferences!", icon="ERROR")
 
     def execute(self, context):
+        global _GENERATION_RUNNING
+
         prefs = get_preferences()
 
         if not prefs.api_key:
@@ -127,7 +331,7 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
 
         # Get the active GP object
         gp_obj = context.active_object
-        if gp_obj.type != "GREASEPENCIL":
+        if not _is_gp(gp_obj):
             self.report({"ERROR"}, "Active object is not a Grease Pencil object")
             return {"CANCELLED"}
 
@@ -145,119 +349,487 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
             self.report({"ERROR"}, "Keyframes must be at least 2 frames apart")
             return {"CANCELLED"}
 
+        # Held by name and looked up every tick: undo or deleting the object
+        # mid-run would leave an RNA reference dangling
+        self._binary = binary
+        self._gp_name = gp_obj.name
+        self._frame_a_num = frame_a_num
+        self._frame_b_num = frame_b_num
+        self._proc = None
+        self._log_file = None
+        self._deadline = None
+        self._streaming = False
+        self._stdout_buf = b""
+        self._streamed_frames = 0
+        self._accepted_batch = []
+        self._pending_imports = []
+        self._num_imported = 0
+        self._dropped_frames = 0
+        self._metadata = None
+        self._raw_frames = None
+        self._cache_entry = None
+        self._from_cache = False
+        self._frame_positions = self.calculate_frame_positions(
+            frame_a_num, frame_b_num, self.num_frames
+        )
+
+        # Frame numbers on the layer being imported into, taken when the
+        # first frame is imported (see existing_frames)
+        self._existing_frames = None
+        self._existing_layer = None
+
+        # Reuse the same exchange slots every run instead of a fresh temp dir
+        work_dir = get_work_dir()
+
+        self._png_a = work_dir / "frame_a.png"
+        self._png_b = work_dir / "frame_b.png"
+        self._output_dir = work_dir / "generated"
+        self._log_path = work_dir / "generate.log"
+
+        # Clear frames left over from the previous run
+        for entry in os.scandir(self._output_dir):
+            os.unlink(entry.path)
+
+        # Config lives at a stable path and is only rewritten when it changes
         try:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir = Path(tmpdir)
-
-                png_a = tmpdir / "frame_a.png"
-                png_b = tmpdir / "frame_b.png"
-                output_dir = tmpdir / "generated"
-                output_dir.mkdir()
-                config_path = tmpdir / "config.toml"
-
-                # Write config
-                write_config_file(
-                    config_path, prefs.api_key, prefs.auto_accept_threshold
-                )
+            self._config_path = get_config_path(
+                prefs.api_key, prefs.auto_accept_threshold
+            )
+        except OSError as e:
+            self.report({"ERROR"}, f"Could not write config: {e}")
+            return {"CANCELLED"}
 
-                # Export frames
-                self.export_gp_frame_to_png(context, gp_obj, frame_a_num, png_a)
-                self.export_gp_frame_to_png(context, gp_obj, frame_b_num, png_b)
+        # Work happens across timer ticks so the UI stays responsive
+        self._state = "EXPORT"
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
 
-                # Build command
-                cmd = [
-                    binary,
-                    "generate",
-                    "--frame-a",
-                    str(png_a),
-                    "--frame-b",
-                    str(png_b),
-                    "--num-frames",
-                    str(self.num_frames),
-                    "--output-dir",
-                    str(output_dir),
-                    "--config",
-                    str(config_path),
-                ]
-
-                if self.character:
-                    cmd.extend(["--character", self.character])
-
-                if prefs.verbose_logging:
-                    cmd.insert(1, "--verbose")
-
-                # Run generation
-                self.report({"INFO"}, "Generating frames... (this may take a minute)")
-
-                # Get the system PATH including Homebrew
-                env = os.environ.copy()
-                env["PATH"] = "/opt/homebrew/bin:/usr/local/bin:" + env.get("PATH", "")
-
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=300, env=env
-                )
+        # Only once the modal handler is in place, so finish() always clears it
+        _GENERATION_RUNNING = True
 
-                if result.returncode != 0:
-                    error_msg = result.stderr or result.stdout or "Unknown error"
-                    self.report({"ERROR"}, f"Generation failed: {error_msg}")
-                    return {"CANCELLED"}
+        self.report({"INFO"}, "Generating frames... (press Esc to cancel)")
+        return {"RUNNING_MODAL"}
 
-                # Read metadata
-                metadata_path = output_dir / "metadata.json"
-                if metadata_path.exists():
-                    with open(metadata_path) as f:
-                        metadata = json.load(f)
-                else:
-                    metadata = {"confidence_scores": [], "auto_accept": []}
+    def modal(self, context, event):
+        if event.type == "ESC":
+            self.stop_generator()
+            self.report({"WARNING"}, "Generation cancelled")
+            self.finish(context)
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        try:
+            result = self.step(context)
+        except Exception as e:
+            self.report({"ERROR"}, f"Error: {str(e)}")
+            result = {"CANCELLED"}
+
+        if result != {"RUNNING_MODAL"}:
+            self.finish(context)
+        return result
+
+    def cancel(self, context):
+        self.stop_generator()
+        self.finish(context)
 
-                # Import generated frames
-                generated_pngs = sorted(output_dir.glob("*.png"))
+    def stop_generator(self):
+        """Terminate the generate process, killing it if it won't exit."""
+        if self._proc is None or self._proc.poll() is not None:
+            return
+
+        self._proc.terminate()
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+    def step(self, context):
+        """Advance the generation state machine by one timer tick."""
+        global _RAW_INPUT_SUPPORTED
+
+        gp_obj = bpy.data.objects.get(self._gp_name)
+        if not _is_gp(gp_obj):
+            self.stop_generator()
+            self.report({"ERROR"}, f"Grease Pencil object '{self._gp_name}' is gone")
+            return {"CANCELLED"}
 
-                if not generated_pngs:
-                    self.report({"ERROR"}, "No frames were generated")
+        if self._state == "EXPORT":
+            # Prefer raw pixels from an offscreen draw; PNG export otherwise
+            if _RAW_INPUT_SUPPORTED:
+                try:
+                    self._raw_frames = self.capture_gp_frames(
+                        context, [self._frame_a_num, self._frame_b_num]
+                    )
+                except Exception as e:
+                    print(f"[GPAI] Offscreen capture failed, exporting PNGs: {e}")
+                    self._raw_frames = None
+            if self._raw_frames is None:
+                self.export_keyframes(context, gp_obj)
+
+            # Same keyframes and settings as an earlier run: reuse its frames
+            try:
+                self._cache_entry = get_cache_dir() / self.generation_cache_key()
+            except Exception as e:
+                # Cache is an optimisation only; generate as usual without it
+                print(f"[GPAI] Result cache unavailable: {e}")
+                self._cache_entry = None
+
+            if (
+                self._cache_entry is not None
+                and (self._cache_entry / "metadata.json").exists()
+            ):
+                os.utime(self._cache_entry)  # Mark as recently used
+                self._output_dir = self._cache_entry
+                self._from_cache = True
+                self._state = "RESULTS"
+            else:
+                self._state = "SPAWN"
+
+        elif self._state == "SPAWN":
+            self.spawn_generator()
+            self._state = "POLL"
+
+        elif self._state == "POLL":
+            finished = self._proc.poll() is not None
+
+            # Queue each frame as soon as the generator announces it. The
+            # model returns all frames at once, so this only overlaps our
+            # imports with the binary's PNG encoding, not with inference.
+            if self._streaming or finished:
+                for line in self.read_output_lines():
+                    self.handle_output_line(line)
+
+            if not finished:
+                if time.monotonic() > self._deadline:
+                    self.stop_generator()
+                    self.report(
+                        {"ERROR"},
+                        "Generation timed out (5 minutes). Try with fewer frames.",
+                    )
                     return {"CANCELLED"}
 
-                # Calculate frame spacing
-                total_gap = frame_b_num - frame_a_num - 1
-                frame_positions = self.calculate_frame_positions(
-                    frame_a_num, frame_b_num, len(generated_pngs)
-                )
+                # One trace per tick so the UI keeps responding between them
+                self.import_next_frame(context, gp_obj)
+                return {"RUNNING_MODAL"}
+
+            self._log_file.close()
+
+            if self._proc.returncode != 0:
+                error_msg = self._log_path.read_text() or "Unknown error"
+
+                if self.raw_input_rejected(error_msg):
+                    # Older binary: retry the same run with exported PNGs
+                    _RAW_INPUT_SUPPORTED = False
+                    print("[GPAI] Binary has no raw frame input, exporting PNGs")
+                    self._raw_frames = None
+                    self._stdout_buf = b""
+                    self.export_keyframes(context, gp_obj)
+                    self._state = "SPAWN"
+                    return {"RUNNING_MODAL"}
 
-                for i, (png_path, frame_num) in enumerate(
-                    zip(generated_pngs, frame_positions)
-                ):
-                    confidence = metadata.get(
-                        "confidence_scores", [0.0] * len(generated_pngs)
-                    )[i]
-                    auto_accept = metadata.get(
-                        "auto_accept", [False] * len(generated_pngs)
-                    )[i]
+                self.report({"ERROR"}, f"Generation failed: {error_msg}")
+                return {"CANCELLED"}
 
-                    self.import_png_to_gp_frame(context, gp_obj, png_path, frame_num)
+            self.store_in_cache()
 
-                    if auto_accept:
-                        self.log_acceptance(binary, frame_num, confidence)
+            self._state = "RESULTS"
+
+        elif self._state == "RESULTS":
+            return self.load_results()
+
+        elif self._state == "IMPORT":
+            if self._pending_imports:
+                self.import_next_frame(context, gp_obj)
+                return {"RUNNING_MODAL"}
+            return self.report_results(context)
+
+        return {"RUNNING_MODAL"}
+
+    def export_keyframes(self, context, gp_obj):
+        """Render both keyframes to the PNG exchange slots."""
+        self.export_gp_frames_to_png(
+            context,
+            gp_obj,
+            [
+                (self._frame_a_num, self._png_a),
+                (self._frame_b_num, self._png_b),
+            ],
+        )
+
+    def raw_input_rejected(self, error_msg):
+        """True if a raw-input run failed because the binary lacks the flag."""
+        # clap exits with 2 on usage errors, before anything is generated
+        return (
+            self._raw_frames is not None
+            and self._proc.returncode == 2
+            and "--frame-a-raw" in error_msg
+        )
+
+    def store_in_cache(self):
+        """Keep a successful run's output for identical future requests."""
+        if self._cache_entry is None:
+            return
+
+        # An empty result would otherwise be replayed for this input forever
+        if not list_generated_pngs(self._output_dir):
+            return
 
-                # Store info for later
-                context.scene.gpai.last_motion_type = metadata.get(
-                    "motion_type", "unknown"
+        # Copy into a sibling and rename it into place, so an interrupted
+        # copy can never leave a hit with metadata.json but missing frames.
+        # The frames are already usable; a cache failure must not cancel.
+        cache_dir = self._cache_entry.parent
+        staging = None
+        try:
+            staging = Path(tempfile.mkdtemp(prefix=".part-", dir=cache_dir))
+            shutil.copytree(self._output_dir, staging, dirs_exist_ok=True)
+            shutil.rmtree(self._cache_entry, ignore_errors=True)
+            os.replace(staging, self._cache_entry)
+            evict_cache(cache_dir)
+        except OSError as e:
+            print(f"[GPAI] Could not cache generated frames: {e}")
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def generation_cache_key(self):
+        """Hash everything that determines the generated frames."""
+        prefs = get_preferences()
+        digest = hashlib.blake2b()
+
+        if self._raw_frames is not None:
+            width, height, frames = self._raw_frames
+            digest.update(f"raw:{width}x{height}".encode())
+            for pixels in frames:
+                digest.update(pixels)
+        else:
+            for png in (self._png_a, self._png_b):
+                _hash_png_pixels(digest, png)
+
+        # Character feeds the confidence scorer's history lookup
+        digest.update(
+            f"|{self.num_frames}|{_REPLICATE_MODEL}|{prefs.auto_accept_threshold}"
+            f"|{self.character}".encode()
+        )
+        return digest.hexdigest()
+
+    def spawn_generator(self):
+        """Start the Rust generate command without waiting for it."""
+        prefs = get_preferences()
+
+        if self._raw_frames is not None:
+            width, height, _ = self._raw_frames
+            size = f"{width}x{height}"
+            frame_args = ["--frame-a-raw", size, "--frame-b-raw", size]
+        else:
+            frame_args = ["--frame-a", str(self._png_a), "--frame-b", str(self._png_b)]
+
+        # Build command
+        cmd = [
+            self._binary,
+            "generate",
+            *frame_args,
+            "--num-frames",
+            str(self.num_frames),
+            "--output-dir",
+            str(self._output_dir),
+            "--config",
+            str(self._config_path),
+        ]
+
+        if self.character:
+            cmd.extend(["--character", self.character])
+
+        if prefs.verbose_logging:
+            cmd.insert(1, "--verbose")
+
+        # Get the system PATH including Homebrew
+        env = os.environ.copy()
+        env["PATH"] = "/opt/homebrew/bin:/usr/local/bin:" + env.get("PATH", "")
+
+        # Logs go to a file so a chatty run can't fill the pipe and stall
+        self._log_file = open(self._log_path, "w")
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if self._raw_frames is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=self._log_file,
+            env=env,
+        )
+        self._deadline = time.monotonic() + 300  # 5 minute timeout
+
+        if self._raw_frames is not None:
+            # Both keyframes back to back; the binary reads them first thing
+            try:
+                for pixels in self._raw_frames[2]:
+                    self._proc.stdin.write(pixels)
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass  # Exited early; POLL reports its error
+
+        # Non-blocking pipes on Windows need Python 3.12; without them we
+        # only read stdout once the process has exited
+        try:
+            os.set_blocking(self._proc.stdout.fileno(), False)
+            self._streaming = True
+        except (AttributeError, OSError):
+            self._streaming = False
+
+    def read_output_lines(self):
+        """Return complete stdout lines written by the generator so far."""
+        fd = self._proc.stdout.fileno()
+
+        # Cheap readiness check before touching the pipe; select() only
+        # handles pipes on POSIX
+        if self._streaming and os.name == "posix":
+            ready, _, _ = select.select([fd], [], [], 0)
+            if not ready:
+                return []
+
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        self._stdout_buf += b"".join(chunks)
+        *lines, self._stdout_buf = self._stdout_buf.split(b"\n")
+        return [line.decode(errors="replace") for line in lines]
+
+    def handle_output_line(self, line):
+        """Queue the frame announced by a `FRAME n path conf auto` line."""
+        if not line.startswith("FRAME "):
+            return
+
+        try:
+            index, rest = line[len("FRAME ") :].split(" ", 1)
+            png_path, confidence, auto_accept = rest.rsplit(" ", 2)
+            index = int(index)
+            confidence = float(confidence)
+        except ValueError:
+            print(f"[GPAI] Ignoring malformed output line: {line}")
+            return
+
+        if index >= len(self._frame_positions):
+            self._dropped_frames += 1
+            print(f"[GPAI] Dropping frame {index}: only {self.num_frames} requested")
+            return
+
+        frame_num = self._frame_positions[index]
+        self._pending_imports.append(
+            (png_path, frame_num, confidence, auto_accept == "true")
+        )
+        self._streamed_frames += 1
+
+    def import_next_frame(self, context, gp_obj):
+        """Trace the oldest queued frame into the GP object, if any."""
+        if not self._pending_imports:
+            return
+
+        png_path, frame_num, confidence, auto_accept = self._pending_imports.pop(0)
+        self.import_png_to_gp_frame(context, gp_obj, png_path, frame_num)
+        self._num_imported += 1
+
+        # Cached flags were logged when the result was first generated;
+        # logging them again would duplicate records and skew the stats
+        if auto_accept and not self._from_cache:
+            self.queue_acceptance(frame_num, confidence)
+
+    def load_results(self):
+        """Read the run's metadata and queue any PNGs that were not streamed."""
+        output_dir = self._output_dir
+
+        # Read metadata
+        metadata_path = output_dir / "metadata.json"
+        if metadata_path.exists():
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        else:
+            metadata = {"confidence_scores": [], "auto_accept": []}
+        self._metadata = metadata
+
+        # Binaries that don't announce frames on stdout (and cache hits):
+        # queue everything in the output directory
+        if self._streamed_frames == 0:
+            generated_pngs = list_generated_pngs(output_dir)
+
+            if not generated_pngs:
+                self.report({"ERROR"}, "No frames were generated")
+                return {"CANCELLED"}
+
+            # Same spacing as streamed frames: one slot per requested frame
+            frame_positions = self._frame_positions
+            if len(generated_pngs) > len(frame_positions):
+                self._dropped_frames += len(generated_pngs) - len(frame_positions)
+                print(
+                    f"[GPAI] Got {len(generated_pngs)} frames, "
+                    f"only {self.num_frames} requested; dropping the rest"
                 )
-                context.scene.gpai.character_name = self.character
 
-                self.report(
-                    {"INFO"},
-                    f"Generated {len(generated_pngs)} frames between {frame_a_num} and {frame_b_num}",
+            # Look the defaults up once rather than rebuilding them per frame
+            confidences = metadata.get("confidence_scores") or [0.0] * len(
+                generated_pngs
+            )
+            auto_accepts = metadata.get("auto_accept") or [False] * len(generated_pngs)
+
+            for i, (png_path, frame_num) in enumerate(
+                zip(generated_pngs, frame_positions)
+            ):
+                self._pending_imports.append(
+                    (png_path, frame_num, confidences[i], auto_accepts[i])
                 )
-                return {"FINISHED"}
 
-        except subprocess.TimeoutExpired:
+        self._state = "IMPORT"
+        return {"RUNNING_MODAL"}
+
+    def report_results(self, context):
+        """Store the run's info on the scene once every frame is imported."""
+        # Only write on change; each write redraws the sidebar panels
+        gpai = context.scene.gpai
+        motion_type = self._metadata.get("motion_type", "unknown")
+        if gpai.last_motion_type != motion_type:
+            gpai.last_motion_type = motion_type
+        if gpai.character_name != self.character:
+            gpai.character_name = self.character
+
+        self.report(
+            {"INFO"},
+            f"Generated {self._num_imported} frames between "
+            f"{self._frame_a_num} and {self._frame_b_num}",
+        )
+        if self._dropped_frames:
             self.report(
-                {"ERROR"}, "Generation timed out (5 minutes). Try with fewer frames."
+                {"WARNING"},
+                f"Dropped {self._dropped_frames} extra frames returned by the API",
             )
-            return {"CANCELLED"}
-        except Exception as e:
-            self.report({"ERROR"}, f"Error: {str(e)}")
-            return {"CANCELLED"}
+        return {"FINISHED"}
+
+    def finish(self, context):
+        """Stop the timer and release the exchange directory for the next run."""
+        global _GENERATION_RUNNING
+
+        # Frames already imported stay in the timeline even on cancel
+        self.log_acceptances(self._binary, self._accepted_batch)
+        self._accepted_batch = []
+
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+            self._proc.wait()
+
+        if self._log_file is not None and not self._log_file.closed:
+            self._log_file.close()
+
+        _GENERATION_RUNNING = False
 
     def get_selected_keyframes(self, context, gp_obj):
         """Get list of selected keyframe numbers from the active GP layer."""
@@ -278,13 +850,10 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
             current = context.scene.frame_current
             frame_numbers = sorted([f.frame_number for f in layer.frames])
 
-            if frame_numbers:
-                # Find current or previous keyframe
-                prev_frames = [f for f in frame_numbers if f <= current]
-                next_frames = [f for f in frame_numbers if f > current]
-
-                if prev_frames and next_frames:
-                    keyframes = [prev_frames[-1], next_frames[0]]
+            # Find current or previous keyframe and the one after it
+            split = bisect.bisect_right(frame_numbers, current)
+            if 0 < split < len(frame_numbers):
+                keyframes = [frame_numbers[split - 1], frame_numbers[split]]
 
         return sorted(keyframes)
 
@@ -303,39 +872,127 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
 
         return positions
 
-    def export_gp_frame_to_png(self, context, gp_obj, frame_num, output_path):
-        """Export a GP frame to PNG file."""
-        # Store original state
-        original_frame = context.scene.frame_current
+    def capture_gp_frames(self, context, frame_nums):
+        """Draw frames offscreen and read the pixels.
 
-        # Set to target frame
-        context.scene.frame_set(frame_num)
+        Frames the view the same way render.opengl does for the PNG fallback:
+        through the scene camera in camera view, otherwise the 3D view's own
+        matrices. Skips the PNG encode of render.opengl. Returns
+        (width, height, frames) where each frame is RGBA8 bytes with rows
+        bottom-up, as read back from the GPU, or None if there is no 3D view
+        (or camera, in camera view) to draw with.
+        """
+        scene = context.scene
+        camera = scene.camera
+        space = context.space_data
+        area = context.area
+
+        if bpy.app.background:
+            return None
+        if space is None or space.type != "VIEW_3D" or area is None:
+            return None
+
+        # Operators run from the sidebar get its UI region, which has no
+        # RegionView3D for draw_view3d to read; use the area's main region
+        region = next((r for r in area.regions if r.type == "WINDOW"), None)
+        if region is None:
+            return None
+
+        rv3d = region.data
+        use_camera = rv3d.view_perspective == "CAMERA"
+        if use_camera and camera is None:
+            return None
+
+        scale = scene.render.resolution_percentage / 100
+        width = int(scene.render.resolution_x * scale)
+        height = int(scene.render.resolution_y * scale)
+
+        original_frame = scene.frame_current
+        offscreen = gpu.types.GPUOffScreen(width, height)
+        frames = []
 
-        # Set up render settings for GP export
+        try:
+            for frame_num in frame_nums:
+                scene.frame_set(frame_num)
+
+                if use_camera:
+                    depsgraph = context.evaluated_depsgraph_get()
+                    camera_eval = camera.evaluated_get(depsgraph)
+                    view_matrix = camera_eval.matrix_world.inverted()
+                    projection_matrix = camera_eval.calc_matrix_camera(
+                        depsgraph, x=width, y=height
+                    )
+                else:
+                    view_matrix = rv3d.view_matrix
+                    projection_matrix = rv3d.window_matrix
+
+                offscreen.draw_view3d(
+                    scene,
+                    context.view_layer,
+                    space,
+                    region,
+                    view_matrix,
+                    projection_matrix,
+                    do_color_management=True,
+                )
+
+                buffer = offscreen.texture_color.read()
+                buffer.dimensions = width * height * 4
+                frames.append(bytes(buffer))
+        finally:
+            offscreen.free()
+            scene.frame_set(original_frame)
+
+        return width, height, frames
+
+    def export_gp_frames_to_png(self, context, gp_obj, exports):
+        """Export GP frames to PNG files.
+
+        `exports` is a list of (frame_num, output_path) pairs. Render settings
+        and the current frame are saved and restored once for the whole batch.
+        """
         scene = context.scene
+
+        # Store original state
+        original_frame = scene.frame_current
         original_filepath = scene.render.filepath
         original_format = scene.render.image_settings.file_format
         original_color_mode = scene.render.image_settings.color_mode
 
         try:
-            scene.render.filepath = str(output_path)
+            # Set up render settings for GP export
             scene.render.image_settings.file_format = "PNG"
             scene.render.image_settings.color_mode = "RGBA"
 
-            # Render using OpenGL (shows GP strokes)
-            bpy.ops.render.opengl(write_still=True)
+            for frame_num, output_path in exports:
+                scene.frame_set(frame_num)
+                scene.render.filepath = str(output_path)
+
+                # Render using OpenGL (shows GP strokes)
+                bpy.ops.render.opengl(write_still=True)
 
         finally:
             # Restore original state
             scene.render.filepath = original_filepath
             scene.render.image_settings.file_format = original_format
             scene.render.image_settings.color_mode = original_color_mode
-            context.scene.frame_set(original_frame)
+            scene.frame_set(original_frame)
+
+    def existing_frames(self, layer):
+        """Return the frame numbers on `layer`, so imports don't rescan it.
+
+        Taken when importing starts rather than in execute, since the user
+        can keep editing while the generator runs, and retaken if the active
+        layer changes. Numbers rather than frame references: RNA pointers
+        may not survive the joins done while importing.
+        """
+        if self._existing_layer != layer.name:
+            self._existing_frames = {f.frame_number for f in layer.frames}
+            self._existing_layer = layer.name
+        return self._existing_frames
 
     def import_png_to_gp_frame(self, context, gp_obj, png_path, frame_num):
         """Trace a raster PNG into Grease Pencil strokes on the given frame."""
-        import shutil
-
         gp_data = gp_obj.data
         layer = gp_data.layers.active
 
@@ -344,10 +1001,10 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
             return
 
         # Remove existing frame at this position
-        for frame in layer.frames:
-            if frame.frame_number == frame_num:
-                layer.frames.remove(frame.frame_number)
-                break
+        existing = self.existing_frames(layer)
+        if frame_num in existing:
+            layer.frames.remove(frame_num)
+            existing.discard(frame_num)
 
         # Persist the image beyond temp directory lifetime
         if bpy.data.filepath:
@@ -358,20 +1015,59 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
         persistent_path = persistent_dir / f"frame_{frame_num:04d}.png"
         shutil.copy2(str(png_path), str(persistent_path))
 
-        # Save editor state
+        # Save editor state. Imports run between the user's own edits, so
+        # mode, selection and active object are all put back afterwards;
+        # by name, since the join below can invalidate object references.
+        view_layer = context.view_layer
         original_frame = context.scene.frame_current
-        original_mode = context.mode
+        original_active = view_layer.objects.active
+        original_active_name = original_active.name if original_active else None
+        original_mode = original_active.mode if original_active else "OBJECT"
+        original_selected = [obj.name for obj in context.selected_objects]
+
         if original_mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
         context.scene.frame_set(frame_num)
 
-        # Create temporary image empty for trace_image to read from
-        bpy.ops.object.select_all(action="DESELECT")
-        bpy.ops.object.empty_image_add(
-            filepath=str(persistent_path),
-            location=gp_obj.location,
-        )
-        trace_empty = context.active_object
+        try:
+            self.trace_png_into(context, gp_obj, layer, persistent_path, frame_num)
+        finally:
+            # Restore the user's selection, active object, mode and frame
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for name in original_selected:
+                obj = view_layer.objects.get(name)
+                if obj is not None:
+                    obj.select_set(True)
+
+            active = None
+            if original_active_name is not None:
+                active = view_layer.objects.get(original_active_name)
+            view_layer.objects.active = active
+            if active is not None and original_mode != "OBJECT":
+                bpy.ops.object.mode_set(mode=original_mode)
+
+            context.scene.frame_set(original_frame)
+
+    def trace_png_into(self, context, gp_obj, layer, png_path, frame_num):
+        """Trace `png_path` and join the strokes into `gp_obj` at `frame_num`."""
+        existing = self.existing_frames(layer)
+
+        # Create temporary image empty for trace_image to read from. The data
+        # API skips the operator stack (poll, undo push, redraw) of empty_add.
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        trace_image = bpy.data.images.load(str(png_path))
+        trace_empty = bpy.data.objects.new(f"GPAI_Ref_{frame_num}", None)
+        trace_empty.empty_display_type = "IMAGE"
+        trace_empty.empty_display_size = 1.0
+        trace_empty.data = trace_image
+        trace_empty.location = gp_obj.location
+        context.collection.objects.link(trace_empty)
+
+        # trace_image works on the active object
+        trace_empty.select_set(True)
+        context.view_layer.objects.active = trace_empty
 
         # Trace the image into a new temporary GP object
         traced_gp = None
@@ -401,48 +1097,88 @@ class GPAI_OT_GenerateInbetweens(bpy.types.Operator):
             except Exception as e:
                 print(f"[GPAI] join failed for frame {frame_num}: {e}")
                 # Clean up the traced object if join failed
-                bpy.ops.object.select_all(action="DESELECT")
-                traced_gp.select_set(True)
-                bpy.ops.object.delete()
+                bpy.data.objects.remove(traced_gp, do_unlink=True)
                 layer.frames.new(frame_num)
+                existing.add(frame_num)
         else:
             # Tracing failed; create an empty frame so timeline isn't broken
             layer.frames.new(frame_num)
+            existing.add(frame_num)
             print(f"[GPAI] Could not trace frame {frame_num}, created empty frame")
 
-        # Remove temporary image empty
-        bpy.ops.object.select_all(action="DESELECT")
-        trace_empty.select_set(True)
-        bpy.ops.object.delete()
+        # Remove temporary image empty and its image
+        bpy.data.objects.remove(trace_empty, do_unlink=True)
+        bpy.data.images.remove(trace_image)
+
+    def queue_acceptance(self, frame_num, confidence):
+        """Remember an auto-accepted frame to log when the run finishes."""
+        self._accepted_batch.append(
+            {
+                "frame_number": frame_num,
+                "character": self.character or "unknown",
+                "motion_type": "unknown",
+                "auto": True,
+                "confidence": confidence,
+            }
+        )
 
-        # Restore state
-        context.view_layer.objects.active = gp_obj
-        gp_obj.select_set(True)
-        context.scene.frame_set(original_frame)
+    def log_acceptances(self, binary, entries):
+        """Log auto-acceptance of several frames on the background log thread."""
+        if not entries:
+            return
 
-    def log_acceptance(self, binary, frame_num, confidence):
-        """Log auto-acceptance of a frame."""
-        try:
-            subprocess.run(
-                [
+        get_log_executor().submit(_log_acceptances, binary, entries)
+
+
+def _log_acceptances(binary, entries):
+    """Send one accept-batch command; runs on the log executor.
+
+    Binaries without accept-batch get one `accept --auto` call per entry.
+    """
+    global _ACCEPT_BATCH_SUPPORTED
+
+    try:
+        if _ACCEPT_BATCH_SUPPORTED:
+            try:
+                run_command(
                     binary,
+                    ["accept-batch"],
+                    {"command": "accept_batch", "entries": entries},
+                    timeout=10,
+                    input_text=json.dumps(entries),
+                    check=True,
+                )
+                return
+            except subprocess.CalledProcessError as e:
+                # clap exits with 2 on an unknown subcommand
+                if e.returncode != 2 or "accept-batch" not in (e.stderr or ""):
+                    raise
+                _ACCEPT_BATCH_SUPPORTED = False
+                print("[GPAI] Binary has no accept-batch, logging frames one by one")
+
+        for entry in entries:
+            run_command(
+                binary,
+                [
                     "accept",
                     "--frame-number",
-                    str(frame_num),
+                    str(entry["frame_number"]),
                     "--character",
-                    self.character or "unknown",
+                    entry["character"],
                     "--motion-type",
-                    "unknown",
+                    entry["motion_type"],
                     "--auto",
                     "true",
                     "--confidence",
-                    str(confidence),
+                    str(entry["confidence"]),
                 ],
-                capture_output=True,
+                {"command": "accept", **entry},
                 timeout=5,
+                check=True,
             )
-        except Exception:
-            pass  # Don't fail the whole operation for logging errors
+    except Exception as e:
+        # Don't fail the whole operation for logging errors
+        print(f"[GPAI] Could not log acceptances: {e}")
 
 
 class GPAI_OT_AcceptFrame(bpy.types.Operator):
@@ -452,6 +1188,10 @@ class GPAI_OT_AcceptFrame(bpy.types.Operator):
     bl_label = "Accept Frame"
     bl_options = {"REGISTER", "UNDO"}
 
+    @classmethod
+    def poll(cls, context):
+        return _BINARY_PATH is not None
+
     def execute(self, context):
         try:
             binary = get_binary_path()
@@ -463,9 +1203,9 @@ class GPAI_OT_AcceptFrame(bpy.types.Operator):
         character = context.scene.gpai.character_name or "unknown"
         motion_type = context.scene.gpai.last_motion_type or "unknown"
 
-        subprocess.run(
+        run_command(
+            binary,
             [
-                binary,
                 "accept",
                 "--frame-number",
                 str(frame_num),
@@ -474,7 +1214,12 @@ class GPAI_OT_AcceptFrame(bpy.types.Operator):
                 "--motion-type",
                 motion_type,
             ],
-            capture_output=True,
+            {
+                "command": "accept",
+                "frame_number": frame_num,
+                "character": character,
+                "motion_type": motion_type,
+            },
         )
 
         self.report({"INFO"}, f"Accepted frame {frame_num}")
@@ -503,6 +1248,10 @@ class GPAI_OT_RejectFrame(bpy.types.Operator):
         default="artifacts",
     )
 
+    @classmethod
+    def poll(cls, context):
+        return _BINARY_PATH is not None
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
 
@@ -521,9 +1270,9 @@ class GPAI_OT_RejectFrame(bpy.types.Operator):
         character = context.scene.gpai.character_name or "unknown"
         motion_type = context.scene.gpai.last_motion_type or "unknown"
 
-        subprocess.run(
+        run_command(
+            binary,
             [
-                binary,
                 "reject",
                 "--frame-number",
                 str(frame_num),
@@ -534,7 +1283,13 @@ class GPAI_OT_RejectFrame(bpy.types.Operator):
                 "--issues",
                 self.issues,
             ],
-            capture_output=True,
+            {
+                "command": "reject",
+                "frame_number": frame_num,
+                "character": character,
+                "motion_type": motion_type,
+                "issues": [self.issues],
+            },
         )
 
         self.report({"INFO"}, f"Rejected frame {frame_num}")
@@ -547,6 +1302,10 @@ class GPAI_OT_ShowStats(bpy.types.Operator):
     bl_idname = "gpai.show_stats"
     bl_label = "Show Statistics"
 
+    @classmethod
+    def poll(cls, context):
+        return _BINARY_PATH is not None
+
     def execute(self, context):
         try:
             binary = get_binary_path()
@@ -554,14 +1313,10 @@ class GPAI_OT_ShowStats(bpy.types.Operator):
             self.report({"ERROR"}, str(e))
             return {"CANCELLED"}
 
-        result = subprocess.run(
-            [binary, "stats"],
-            capture_output=True,
-            text=True,
-        )
+        output = run_command(binary, ["stats"], {"command": "stats"})
 
         def draw_popup(self, context):
-            for line in result.stdout.split("\n"):
+            for line in output.split("\n"):
                 if line.strip():
                     self.layout.label(text=line)
 
@@ -578,5 +1333,5 @@ class GPAI_OT_OpenConfig(bpy.types.Operator):
     bl_label = "Open Settings"
 
     def execute(self, context):
-        bpy.ops.preferences.addon_show(module=__package__)
+        bpy.ops.preferences.addon_show(module=_PKG)
         return {"FINISHED"}
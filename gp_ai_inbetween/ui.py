@@ -4,6 +4,27 @@ UI panels for GP AI Inbetween.
 
 import bpy
 
+from .operators import _is_gp
+
+
+def _tag_redraw(context):
+    """Redraw the 3D view sidebars that host our panels."""
+    screen = context.screen
+    if screen is None:
+        return
+
+    for area in screen.areas:
+        if area.type != 'VIEW_3D':
+            continue
+        for region in area.regions:
+            if region.type == 'UI':
+                region.tag_redraw()
+
+
+def redraw_panels(self, context):
+    """Property update callback: show the new value in the panels."""
+    _tag_redraw(context)
+
 
 class GPAI_PT_MainPanel(bpy.types.Panel):
     """Main UI panel in the sidebar."""
@@ -17,8 +38,7 @@ class GPAI_PT_MainPanel(bpy.types.Panel):
         layout = self.layout
 
         # Check for GP object
-        obj = context.active_object
-        if obj is None or obj.type != 'GREASEPENCIL':
+        if not _is_gp(context.active_object):
             layout.label(text="Select a Grease Pencil object", icon='INFO')
             return
 
@@ -48,18 +68,42 @@ class GPAI_PT_ResultsPanel(bpy.types.Panel):
     bl_category = 'GP AI'
     bl_options = {'DEFAULT_CLOSED'}
 
+    # "Frame: N" label, rebuilt only when the frame number changes
+    _last_frame = -1
+    _last_label = ""
+
+    # Labels built from scene properties, keyed by the property values so
+    # undo and file loads (which skip update callbacks) can't leave them stale
+    _cached_key = None
+    _cached_labels = ()
+
     def draw(self, context):
         layout = self.layout
+        scene = context.scene
+        cls = type(self)
 
         # Current frame info
+        frame = scene.frame_current
+        if frame != cls._last_frame:
+            cls._last_label = "Frame: %d" % frame
+            cls._last_frame = frame
         box = layout.box()
-        box.label(text=f"Frame: {context.scene.frame_current}", icon='TIME')
-
-        if context.scene.gpai.last_motion_type:
-            box.label(text=f"Motion: {context.scene.gpai.last_motion_type}")
-
-        if context.scene.gpai.character_name:
-            box.label(text=f"Character: {context.scene.gpai.character_name}")
+        box.label(text=cls._last_label, icon='TIME')
+
+        motion_type = scene.gpai.last_motion_type
+        character = scene.gpai.character_name
+        key = (motion_type, character)
+        if cls._cached_key != key:
+            labels = []
+            if motion_type:
+                labels.append("Motion: %s" % motion_type)
+            if character:
+                labels.append("Character: %s" % character)
+            cls._cached_labels = tuple(labels)
+            cls._cached_key = key
+
+        for label in cls._cached_labels:
+            box.label(text=label)
 
         # Accept/Reject buttons
         row = layout.row(align=True)
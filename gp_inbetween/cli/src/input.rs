@@ -0,0 +1,111 @@
+use anyhow::{Context, Result};
+use image::{DynamicImage, RgbaImage};
+use std::io::Read;
+use std::path::PathBuf;
+
+/// Where a keyframe's pixels come from
+#[derive(Debug)]
+pub enum FrameSource {
+    /// Image file on disk
+    File(PathBuf),
+
+    /// Raw RGBA8 pixels on stdin, rows bottom-up as read back from the GPU
+    RawStdin { width: u32, height: u32 },
+}
+
+impl FrameSource {
+    /// Build from the mutually exclusive `--frame-x` / `--frame-x-raw` args
+    pub fn from_args(path: Option<PathBuf>, raw: Option<(u32, u32)>) -> Result<Self> {
+        match (path, raw) {
+            (Some(path), None) => Ok(Self::File(path)),
+            (None, Some((width, height))) => Ok(Self::RawStdin { width, height }),
+            _ => anyhow::bail!("Expected exactly one of a frame path or a raw frame size"),
+        }
+    }
+
+    /// Check that a file source exists before doing any expensive work
+    pub fn validate(&self, label: &str) -> Result<()> {
+        if let Self::File(path) = self {
+            if !path.exists() {
+                anyhow::bail!("{} does not exist: {}", label, path.display());
+            }
+        }
+        Ok(())
+    }
+
+    /// Decode the frame, reading raw pixels from `stdin` if needed
+    pub fn load(&self, stdin: &mut impl Read) -> Result<DynamicImage> {
+        match self {
+            Self::File(path) => Ok(image::open(path)?),
+            Self::RawStdin { width, height } => {
+                let len = *width as usize * *height as usize * 4;
+                let mut data = vec![0u8; len];
+                stdin
+                    .read_exact(&mut data)
+                    .context("Failed to read raw frame from stdin")?;
+
+                let rgba = RgbaImage::from_raw(*width, *height, data)
+                    .context("Raw frame does not match its size")?;
+
+                // GPU readback starts at the bottom row
+                Ok(DynamicImage::ImageRgba8(image::imageops::flip_vertical(
+                    &rgba,
+                )))
+            }
+        }
+    }
+}
+
+/// Parse a `WIDTHxHEIGHT` size argument
+pub fn parse_raw_size(s: &str) -> Result<(u32, u32), String> {
+    let (width, height) = s
+        .split_once('x')
+        .ok_or_else(|| format!("expected WIDTHxHEIGHT, got '{s}'"))?;
+
+    let width: u32 = width.parse().map_err(|e| format!("bad width: {e}"))?;
+    let height: u32 = height.parse().map_err(|e| format!("bad height: {e}"))?;
+
+    if width == 0 || height == 0 {
+        return Err("size must be non-zero".to_string());
+    }
+
+    Ok((width, height))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use image::GenericImageView;
+    use std::io::Cursor;
+
+    #[test]
+    fn test_parse_raw_size() {
+        assert_eq!(parse_raw_size("1920x1080"), Ok((1920, 1080)));
+        assert!(parse_raw_size("1920").is_err());
+        assert!(parse_raw_size("0x10").is_err());
+    }
+
+    #[test]
+    fn test_load_raw_flips_rows() {
+        // 1x2 image: bottom row red, top row blue (bottom-up order)
+        let bytes = vec![255, 0, 0, 255, 0, 0, 255, 255];
+        let source = FrameSource::RawStdin {
+            width: 1,
+            height: 2,
+        };
+
+        let img = source.load(&mut Cursor::new(bytes)).unwrap();
+
+        assert_eq!(img.get_pixel(0, 0).0, [0, 0, 255, 255]);
+        assert_eq!(img.get_pixel(0, 1).0, [255, 0, 0, 255]);
+    }
+
+    #[test]
+    fn test_load_raw_short_input() {
+        let source = FrameSource::RawStdin {
+            width: 2,
+            height: 2,
+        };
+        assert!(source.load(&mut Cursor::new(vec![0u8; 3])).is_err());
+    }
+}
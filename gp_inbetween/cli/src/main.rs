@@ -1,8 +1,15 @@
 use anyhow::Result;
 use clap::{Parser, Subcommand};
-use gp_core::{Config, FeedbackLogger, Generator, OutputMetadata};
+use gp_core::{AcceptanceRecord, Config, FeedbackLogger, Generator, OutputMetadata, Statistics};
+use std::fmt::Write as _;
+use std::io::Write as _;
 use std::path::PathBuf;
 
+mod input;
+mod serve;
+
+use input::{parse_raw_size, FrameSource};
+
 #[derive(Parser)]
 #[command(name = "gp_inbetween")]
 #[command(author, version, about = "AI-assisted inbetweening for Grease Pencil")]
@@ -20,12 +27,20 @@ enum Commands {
     /// Generate inbetween frames
     Generate {
         /// First keyframe (PNG)
-        #[arg(long)]
-        frame_a: PathBuf,
+        #[arg(long, required_unless_present = "frame_a_raw")]
+        frame_a: Option<PathBuf>,
 
         /// Second keyframe (PNG)
-        #[arg(long)]
-        frame_b: PathBuf,
+        #[arg(long, required_unless_present = "frame_b_raw")]
+        frame_b: Option<PathBuf>,
+
+        /// Read the first keyframe from stdin as raw bottom-up RGBA8 of this size
+        #[arg(long, value_name = "WIDTHxHEIGHT", value_parser = parse_raw_size, conflicts_with = "frame_a")]
+        frame_a_raw: Option<(u32, u32)>,
+
+        /// Read the second keyframe from stdin (after the first) as raw RGBA8
+        #[arg(long, value_name = "WIDTHxHEIGHT", value_parser = parse_raw_size, conflicts_with = "frame_b")]
+        frame_b_raw: Option<(u32, u32)>,
 
         /// Number of frames to generate
         #[arg(long, default_value = "4")]
@@ -71,6 +86,13 @@ enum Commands {
         confidence: Option<f32>,
     },
 
+    /// Accept several frames at once from a JSON array (log feedback)
+    AcceptBatch {
+        /// JSON file to read (reads stdin if omitted)
+        #[arg(long)]
+        input: Option<PathBuf>,
+    },
+
     /// Reject a generated frame (log feedback)
     Reject {
         /// Frame number
@@ -109,6 +131,9 @@ enum Commands {
         json: bool,
     },
 
+    /// Run as a persistent daemon, answering JSON requests on stdin
+    Serve,
+
     /// Generate a default configuration file
     InitConfig {
         /// Output path for config file
@@ -128,6 +153,8 @@ fn main() -> Result<()> {
         Commands::Generate {
             frame_a,
             frame_b,
+            frame_a_raw,
+            frame_b_raw,
             num_frames,
             output_dir,
             config,
@@ -135,8 +162,8 @@ fn main() -> Result<()> {
             motion_type,
         } => {
             run_generate(
-                frame_a,
-                frame_b,
+                FrameSource::from_args(frame_a, frame_a_raw)?,
+                FrameSource::from_args(frame_b, frame_b_raw)?,
                 num_frames,
                 output_dir,
                 config,
@@ -157,6 +184,18 @@ fn main() -> Result<()> {
             println!("Logged acceptance for frame {frame_number}");
         }
 
+        Commands::AcceptBatch { input } => {
+            let json = match input {
+                Some(path) => std::fs::read_to_string(path)?,
+                None => std::io::read_to_string(std::io::stdin())?,
+            };
+            let records: Vec<AcceptanceRecord> = serde_json::from_str(&json)?;
+
+            let logger = FeedbackLogger::new()?;
+            logger.log_acceptances(&records)?;
+            println!("Logged acceptance for {} frames", records.len());
+        }
+
         Commands::Reject {
             frame_number,
             character,
@@ -184,43 +223,15 @@ fn main() -> Result<()> {
             if json {
                 println!("{}", serde_json::to_string_pretty(&stats)?);
             } else {
-                println!("=== GP AI Inbetween Statistics ===");
-                println!();
-                println!("Total generations: {}", stats.total_generations);
-                println!(
-                    "Accepted: {} ({:.1}%)",
-                    stats.accepted,
-                    stats.acceptance_rate * 100.0
-                );
-                println!("  Auto-accepted: {}", stats.auto_accepted);
-                println!("Rejected: {}", stats.rejected);
-                println!();
-
-                if !stats.by_motion_type.is_empty() {
-                    println!("By motion type:");
-                    for (mt, rate) in &stats.by_motion_type {
-                        println!("  {}: {:.1}%", mt, rate * 100.0);
-                    }
-                    println!();
-                }
-
-                if !stats.by_character.is_empty() {
-                    println!("By character:");
-                    for (ch, rate) in &stats.by_character {
-                        println!("  {}: {:.1}%", ch, rate * 100.0);
-                    }
-                    println!();
-                }
-
-                if !stats.common_issues.is_empty() {
-                    println!("Common issues:");
-                    for (issue, count) in stats.common_issues.iter().take(5) {
-                        println!("  {}: {} occurrences", issue, count);
-                    }
-                }
+                print!("{}", format_stats(&stats));
             }
         }
 
+        Commands::Serve => {
+            let logger = FeedbackLogger::new()?;
+            serve::run(&logger)?;
+        }
+
         Commands::InitConfig { output } => {
             let config = Config::default();
             let output_path = output.unwrap_or_else(|| PathBuf::from("gp_ai_config.toml"));
@@ -239,9 +250,52 @@ fn main() -> Result<()> {
     Ok(())
 }
 
+/// Render statistics as the human-readable report shown by `stats`
+fn format_stats(stats: &Statistics) -> String {
+    let mut out = String::new();
+
+    let _ = writeln!(out, "=== GP AI Inbetween Statistics ===");
+    let _ = writeln!(out);
+    let _ = writeln!(out, "Total generations: {}", stats.total_generations);
+    let _ = writeln!(
+        out,
+        "Accepted: {} ({:.1}%)",
+        stats.accepted,
+        stats.acceptance_rate * 100.0
+    );
+    let _ = writeln!(out, "  Auto-accepted: {}", stats.auto_accepted);
+    let _ = writeln!(out, "Rejected: {}", stats.rejected);
+    let _ = writeln!(out);
+
+    if !stats.by_motion_type.is_empty() {
+        let _ = writeln!(out, "By motion type:");
+        for (mt, rate) in &stats.by_motion_type {
+            let _ = writeln!(out, "  {}: {:.1}%", mt, rate * 100.0);
+        }
+        let _ = writeln!(out);
+    }
+
+    if !stats.by_character.is_empty() {
+        let _ = writeln!(out, "By character:");
+        for (ch, rate) in &stats.by_character {
+            let _ = writeln!(out, "  {}: {:.1}%", ch, rate * 100.0);
+        }
+        let _ = writeln!(out);
+    }
+
+    if !stats.common_issues.is_empty() {
+        let _ = writeln!(out, "Common issues:");
+        for (issue, count) in stats.common_issues.iter().take(5) {
+            let _ = writeln!(out, "  {}: {} occurrences", issue, count);
+        }
+    }
+
+    out
+}
+
 fn run_generate(
-    frame_a: PathBuf,
-    frame_b: PathBuf,
+    frame_a: FrameSource,
+    frame_b: FrameSource,
     num_frames: u32,
     output_dir: PathBuf,
     config_path: Option<PathBuf>,
@@ -249,12 +303,13 @@ fn run_generate(
     motion_type: Option<String>,
 ) -> Result<()> {
     // Validate inputs
-    if !frame_a.exists() {
-        anyhow::bail!("Frame A does not exist: {}", frame_a.display());
-    }
-    if !frame_b.exists() {
-        anyhow::bail!("Frame B does not exist: {}", frame_b.display());
-    }
+    frame_a.validate("Frame A")?;
+    frame_b.validate("Frame B")?;
+
+    // Raw frames arrive on stdin in A, B order
+    let mut stdin = std::io::stdin().lock();
+    let img_a = frame_a.load(&mut stdin)?;
+    let img_b = frame_b.load(&mut stdin)?;
 
     // Load config
     let config = if let Some(path) = config_path {
@@ -270,9 +325,9 @@ fn run_generate(
 
     // Generate frames
     log::info!("Generating {} inbetween frames...", num_frames);
-    let results = generator.generate_inbetweens(
-        &frame_a,
-        &frame_b,
+    let results = generator.generate_inbetweens_from_images(
+        &img_a,
+        &img_b,
         num_frames,
         character.as_deref(),
         motion_type.as_deref(),
@@ -284,7 +339,7 @@ fn run_generate(
     // Save outputs
     for (i, scored_frame) in results.frames.iter().enumerate() {
         let output_path = output_dir.join(format!("{:04}.png", i));
-        scored_frame.frame.save(&output_path)?;
+        scored_frame.save_png_atomic(&output_path)?;
 
         let status = if scored_frame.auto_accept {
             "auto-accept"
@@ -297,6 +352,17 @@ fn run_generate(
             scored_frame.score,
             status
         );
+
+        // Announce each frame as soon as it is on disk so callers can import
+        // while the rest are still being written
+        println!(
+            "FRAME {} {} {} {}",
+            i,
+            output_path.display(),
+            scored_frame.score,
+            scored_frame.auto_accept
+        );
+        std::io::stdout().flush()?;
     }
 
     // Write metadata
@@ -0,0 +1,174 @@
+use anyhow::Result;
+use gp_core::{AcceptanceRecord, FeedbackLogger};
+use serde::{Deserialize, Serialize};
+use std::io::{BufRead, Write};
+
+/// A single request read from stdin, one JSON object per line
+#[derive(Debug, Deserialize)]
+#[serde(tag = "command", rename_all = "snake_case")]
+pub enum DaemonRequest {
+    Accept {
+        frame_number: u32,
+        character: String,
+        motion_type: String,
+        #[serde(default)]
+        auto: bool,
+        confidence: Option<f32>,
+    },
+    AcceptBatch {
+        entries: Vec<AcceptanceRecord>,
+    },
+    Reject {
+        frame_number: u32,
+        character: String,
+        motion_type: String,
+        #[serde(default)]
+        issues: Vec<String>,
+        confidence: Option<f32>,
+    },
+    Stats {
+        character: Option<String>,
+        motion_type: Option<String>,
+        #[serde(default)]
+        json: bool,
+    },
+}
+
+/// Response written to stdout, one JSON object per line
+#[derive(Debug, Serialize)]
+pub struct DaemonResponse {
+    pub ok: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub output: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<String>,
+}
+
+impl DaemonResponse {
+    fn success(output: String) -> Self {
+        Self {
+            ok: true,
+            output: Some(output),
+            error: None,
+        }
+    }
+
+    fn failure(error: impl std::fmt::Display) -> Self {
+        Self {
+            ok: false,
+            output: None,
+            error: Some(error.to_string()),
+        }
+    }
+}
+
+/// Answer requests until stdin is closed
+pub fn run(logger: &FeedbackLogger) -> Result<()> {
+    let stdin = std::io::stdin();
+    let mut stdout = std::io::stdout().lock();
+
+    log::info!("Serving requests on stdin");
+
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let response = match serde_json::from_str::<DaemonRequest>(&line) {
+            Ok(request) => match handle(logger, request) {
+                Ok(output) => DaemonResponse::success(output),
+                Err(e) => DaemonResponse::failure(e),
+            },
+            Err(e) => DaemonResponse::failure(format!("Invalid request: {e}")),
+        };
+
+        writeln!(stdout, "{}", serde_json::to_string(&response)?)?;
+        stdout.flush()?;
+    }
+
+    log::info!("stdin closed, shutting down");
+    Ok(())
+}
+
+fn handle(logger: &FeedbackLogger, request: DaemonRequest) -> Result<String> {
+    match request {
+        DaemonRequest::Accept {
+            frame_number,
+            character,
+            motion_type,
+            auto,
+            confidence,
+        } => {
+            logger.log_acceptance(frame_number, &character, &motion_type, auto, confidence)?;
+            Ok(format!("Logged acceptance for frame {frame_number}"))
+        }
+
+        DaemonRequest::AcceptBatch { entries } => {
+            logger.log_acceptances(&entries)?;
+            Ok(format!("Logged acceptance for {} frames", entries.len()))
+        }
+
+        DaemonRequest::Reject {
+            frame_number,
+            character,
+            motion_type,
+            issues,
+            confidence,
+        } => {
+            logger.log_rejection(frame_number, &character, &motion_type, &issues, confidence)?;
+            Ok(format!("Logged rejection for frame {frame_number}"))
+        }
+
+        DaemonRequest::Stats {
+            character,
+            motion_type,
+            json,
+        } => {
+            let stats = logger.get_stats(character.as_deref(), motion_type.as_deref())?;
+            if json {
+                Ok(serde_json::to_string_pretty(&stats)?)
+            } else {
+                Ok(crate::format_stats(&stats))
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_accept_request() {
+        let line = r#"{"command": "accept", "frame_number": 12, "character": "hero", "motion_type": "walk"}"#;
+        let request: DaemonRequest = serde_json::from_str(line).unwrap();
+
+        match request {
+            DaemonRequest::Accept {
+                frame_number,
+                auto,
+                confidence,
+                ..
+            } => {
+                assert_eq!(frame_number, 12);
+                assert!(!auto);
+                assert!(confidence.is_none());
+            }
+            _ => panic!("expected accept request"),
+        }
+    }
+
+    #[test]
+    fn test_parse_unknown_command() {
+        let line = r#"{"command": "explode"}"#;
+        assert!(serde_json::from_str::<DaemonRequest>(line).is_err());
+    }
+
+    #[test]
+    fn test_failure_response_omits_output() {
+        let response = DaemonResponse::failure("boom");
+        let json = serde_json::to_string(&response).unwrap();
+        assert_eq!(json, r#"{"ok":false,"error":"boom"}"#);
+    }
+}
@@ -37,6 +37,24 @@ pub struct Statistics {
     pub common_issues: Vec<(String, u32)>,
 }
 
+/// One acceptance in a batch, as read from `accept-batch` JSON input
+#[derive(Debug, Serialize, Deserialize, Clone)]
+pub struct AcceptanceRecord {
+    pub frame_number: u32,
+    pub character: String,
+    #[serde(default = "AcceptanceRecord::unknown_motion")]
+    pub motion_type: String,
+    #[serde(default)]
+    pub auto: bool,
+    pub confidence: Option<f32>,
+}
+
+impl AcceptanceRecord {
+    fn unknown_motion() -> String {
+        "unknown".to_string()
+    }
+}
+
 pub struct FeedbackLogger {
     log_path: PathBuf,
 }
@@ -77,14 +95,22 @@ impl FeedbackLogger {
     }
 
     fn append_entry(&self, entry: &FeedbackEntry) -> Result<()> {
+        self.append_entries(std::slice::from_ref(entry))
+    }
+
+    fn append_entries(&self, entries: &[FeedbackEntry]) -> Result<()> {
         let mut file = OpenOptions::new()
             .create(true)
             .append(true)
             .open(&self.log_path)
             .context("Failed to open feedback log")?;
 
-        let json = serde_json::to_string(entry)?;
-        writeln!(file, "{json}")?;
+        let mut buf = String::new();
+        for entry in entries {
+            buf.push_str(&serde_json::to_string(entry)?);
+            buf.push('\n');
+        }
+        file.write_all(buf.as_bytes())?;
 
         Ok(())
     }
@@ -148,6 +174,28 @@ impl FeedbackLogger {
         self.append_entry(&entry)
     }
 
+    /// Log several frame acceptances with a single write
+    pub fn log_acceptances(&self, records: &[AcceptanceRecord]) -> Result<()> {
+        log::info!("Logging {} acceptances", records.len());
+
+        let timestamp = Self::current_timestamp();
+        let entries: Vec<FeedbackEntry> = records
+            .iter()
+            .map(|record| FeedbackEntry {
+                timestamp,
+                event: FeedbackEvent::Accept,
+                character: record.character.clone(),
+                motion_type: record.motion_type.clone(),
+                frame_number: Some(record.frame_number),
+                auto_accepted: Some(record.auto),
+                issues: None,
+                confidence_score: record.confidence,
+            })
+            .collect();
+
+        self.append_entries(&entries)
+    }
+
     /// Log frame rejection
     pub fn log_rejection(
         &self,
@@ -395,6 +443,28 @@ mod tests {
         assert!((stats.acceptance_rate - 0.5).abs() < 0.01);
     }
 
+    #[test]
+    fn test_log_acceptances_batch() {
+        let dir = tempdir().unwrap();
+        let log_path = dir.path().join("test_feedback.jsonl");
+        let logger = FeedbackLogger::with_path(log_path).unwrap();
+
+        let records: Vec<AcceptanceRecord> = serde_json::from_str(
+            r#"[
+                {"frame_number": 3, "character": "hero", "auto": true, "confidence": 0.91},
+                {"frame_number": 5, "character": "hero", "auto": true, "confidence": 0.88}
+            ]"#,
+        )
+        .unwrap();
+        assert_eq!(records[0].motion_type, "unknown");
+
+        logger.log_acceptances(&records).unwrap();
+
+        let stats = logger.get_stats(Some("hero"), None).unwrap();
+        assert_eq!(stats.accepted, 2);
+        assert_eq!(stats.auto_accepted, 2);
+    }
+
     #[test]
     fn test_filter_by_character() {
         let dir = tempdir().unwrap();
@@ -7,7 +7,7 @@ pub mod preprocessing;
 pub use api::ApiClient;
 pub use config::Config;
 pub use confidence::{ConfidenceScorer, detect_motion_type};
-pub use feedback::{FeedbackLogger, Statistics};
+pub use feedback::{AcceptanceRecord, FeedbackLogger, Statistics};
 pub use preprocessing::{PaddingInfo, Preprocessor};
 
 use anyhow::Result;
@@ -60,13 +60,25 @@ impl Generator {
         let img_a = image::open(frame_a_path)?;
         let img_b = image::open(frame_b_path)?;
 
+        self.generate_inbetweens_from_images(&img_a, &img_b, num_frames, character, motion_type)
+    }
+
+    /// Generate inbetween frames from two already-decoded keyframes
+    pub fn generate_inbetweens_from_images(
+        &self,
+        img_a: &DynamicImage,
+        img_b: &DynamicImage,
+        num_frames: u32,
+        character: Option<&str>,
+        motion_type: Option<&str>,
+    ) -> Result<GenerationResult> {
         // Store original dimensions for potential restoration
         let (orig_width, orig_height) = img_a.dimensions();
         let padding_info = self.preprocessor.get_padding_info(orig_width, orig_height);
 
         // 2. Preprocess
-        let cleaned_a = self.preprocessor.process(&img_a)?;
-        let cleaned_b = self.preprocessor.process(&img_b)?;
+        let cleaned_a = self.preprocessor.process(img_a)?;
+        let cleaned_b = self.preprocessor.process(img_b)?;
 
         // 3. Auto-detect motion type if not provided
         let detected_motion = motion_type
@@ -177,6 +189,18 @@ pub struct ScoredFrame {
     pub auto_accept: bool,
 }
 
+impl ScoredFrame {
+    /// Save the frame as PNG via a temporary file and rename, so a reader
+    /// watching the directory never sees a partially written image
+    pub fn save_png_atomic(&self, path: &Path) -> Result<()> {
+        let tmp_path = path.with_extension("png.part");
+        self.frame
+            .save_with_format(&tmp_path, image::ImageFormat::Png)?;
+        std::fs::rename(&tmp_path, path)?;
+        Ok(())
+    }
+}
+
 /// Result of a generation operation
 #[derive(Debug)]
 pub struct GenerationResult {
@@ -248,4 +272,21 @@ mod tests {
         assert_eq!(output.confidence_scores.len(), 2);
         assert_eq!(output.auto_accept, vec![true, false]);
     }
+
+    #[test]
+    fn test_save_png_atomic() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("0000.png");
+        let frame = ScoredFrame {
+            frame: DynamicImage::new_rgba8(4, 4),
+            score: 0.9,
+            auto_accept: true,
+        };
+
+        frame.save_png_atomic(&path).unwrap();
+
+        assert!(path.exists());
+        assert!(!dir.path().join("0000.png.part").exists());
+        assert_eq!(image::open(&path).unwrap().dimensions(), (4, 4));
+    }
 }